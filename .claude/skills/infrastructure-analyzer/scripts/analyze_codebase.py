@@ -4,28 +4,204 @@ Analyzes a codebase to extract infrastructure information.
 Detects tech stack, dependencies, frameworks, and generates structured data.
 """
 
+import copy
+import itertools
 import json
+import mmap
 import os
 import re
+from collections import ChainMap
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-
-
-def detect_project_type(project_root: Path) -> Dict[str, Any]:
-    """Detect the primary project type and framework."""
+from typing import Dict, Final, Iterator, List, Any, Optional, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # optional, the compiled keyword regex is used instead
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # optional, the stdlib json module is used instead
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+
+DB_KEYWORDS: Final[Dict[str, List[str]]] = {
+    "postgresql": ["pg", "psycopg2", "postgres"],
+    "mysql": ["mysql", "mysql2", "pymysql"],
+    "mongodb": ["mongodb", "mongoose", "pymongo"],
+    "redis": ["redis", "ioredis"],
+    "sqlite": ["sqlite", "sqlite3"],
+    "convex": ["convex"],
+    "supabase": ["supabase"],
+    "firebase": ["firebase"],
+}
+
+AUTH_KEYWORDS: Final[Dict[str, List[str]]] = {
+    "NextAuth.js": ["next-auth"],
+    "Auth0": ["auth0"],
+    "Firebase Auth": ["firebase"],
+    "Clerk": ["@clerk/"],
+    "Supabase Auth": ["@supabase/"],
+    "Passport": ["passport"],
+    "JWT": ["jsonwebtoken", "jwt"],
+    "Convex Auth": ["@convex-dev/auth"],
+    "Stack Auth": ["@stackframe/"],
+}
+
+PAYMENT_KEYWORDS: Final[Dict[str, List[str]]] = {
+    "Stripe": ["stripe"],
+    "PayPal": ["paypal"],
+    "Square": ["square"],
+    "Braintree": ["braintree"],
+}
+
+EMAIL_KEYWORDS: Final[Dict[str, List[str]]] = {
+    "Resend": ["resend"],
+    "SendGrid": ["sendgrid"],
+    "Mailgun": ["mailgun"],
+    "Postmark": ["postmark"],
+    "Nodemailer": ["nodemailer"],
+}
+
+HOSTING_INDICATORS: Final[Dict[str, List[str]]] = {
+    "Netlify": ["netlify.toml", "netlify"],
+    "Vercel": ["vercel.json", ".vercel"],
+    "AWS": [".aws", "serverless.yml"],
+    "Heroku": ["Procfile"],
+    "Docker": ["Dockerfile", "docker-compose.yml"],
+}
+
+ENV_FILES: Final[Tuple[str, ...]] = (".env", ".env.local", ".env.example")
+
+
+# Category -> provider keyword table. Database and auth report only the
+# highest-ranked provider (earliest in its table); payment and email list all.
+_CATEGORY_TABLES = {
+    "database": DB_KEYWORDS,
+    "auth": AUTH_KEYWORDS,
+    "payment": PAYMENT_KEYWORDS,
+    "email": EMAIL_KEYWORDS,
+}
+_SINGLE_MATCH_CATEGORIES = {"database", "auth"}
+# Auth keywords are matched against the dependency name as written
+_CASE_SENSITIVE_CATEGORIES = {"auth"}
+
+
+def _build_category_index(tables: Dict[str, Dict[str, List[str]]]) -> Tuple[Dict[str, List[Tuple[str, str, int, str]]], "re.Pattern[str]"]:
+    """Merge the keyword tables into one index and compile one pattern over every keyword.
+
+    The pattern is a lookahead, so matches at every position are reported,
+    and alternatives are tried longest first. Any other keyword matching at
+    the same position is then a prefix of the reported one, so each keyword
+    maps to the ``(keyword, category, rank, provider)`` hits of itself and all
+    of its prefixes. ``rank`` is the provider's position in its table.
+    """
+    hits = {}
+    for category, table in tables.items():
+        for rank, (provider, keywords) in enumerate(table.items()):
+            for kw in keywords:
+                hits.setdefault(kw, []).append((kw, category, rank, provider))
+    keywords = sorted(hits, key=len, reverse=True)
+    index = {kw: [hit for prefix in keywords if kw.startswith(prefix) for hit in hits[prefix]]
+             for kw in keywords}
+    pattern = re.compile("(?=(%s))" % "|".join(re.escape(kw) for kw in keywords))
+    return index, pattern
+
+
+_CATEGORY_INDEX, _CATEGORY_RE = _build_category_index(_CATEGORY_TABLES)
+
+
+def _build_category_automaton(index: Dict[str, List[Tuple[str, str, int, str]]]) -> Optional["ahocorasick.Automaton"]:
+    """Build an Aho-Corasick automaton over the keyword index when pyahocorasick is installed.
+
+    The automaton reports every occurrence of every keyword, so each keyword
+    only needs its own hits rather than those of its prefixes.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw, hits in index.items():
+        automaton.add_word(kw, [hit for hit in hits if hit[0] == kw])
+    automaton.make_automaton()
+    return automaton
+
+
+_CATEGORY_AUTOMATON = _build_category_automaton(_CATEGORY_INDEX)
+
+
+def _keyword_hits(text: str) -> Iterator[List[Tuple[str, str, int, str]]]:
+    """Yield the category hits for each keyword occurrence in ``text``."""
+    if _CATEGORY_AUTOMATON is not None:
+        for _, hits in _CATEGORY_AUTOMATON.iter(text):
+            yield hits
+    else:
+        for m in _CATEGORY_RE.finditer(text):
+            yield _CATEGORY_INDEX[m.group(1)]
+
+
+# name, operator and version of a requirements.txt line
+_REQ_LINE_RE = re.compile(r"([A-Za-z0-9_-]+)([=><]+)?([\d.]+)?")
+
+
+def _load_json(path: Path) -> Optional[Dict[str, Any]]:
+    """Read and parse a JSON manifest, returning None if it cannot be loaded."""
+    try:
+        return _json_loads(path.read_bytes())
+    except Exception:
+        return None
+
+
+def _scan_root(project_root: Path) -> Dict[str, os.DirEntry]:
+    """List the project root once so detectors can check for files without a stat each."""
+    try:
+        with os.scandir(project_root) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
+
+def _is_dir_entry(root_entries: Dict[str, os.DirEntry], name: str) -> bool:
+    """Check a top-level entry is a directory using the type cached by scandir."""
+    entry = root_entries.get(name)
+    return entry is not None and entry.is_dir()
+
+
+def _has_py_file(path: Path) -> bool:
+    """Return True as soon as one ``.py`` file is found directly under ``path``."""
+    try:
+        with os.scandir(path) as it:
+            return any(entry.name.endswith(".py") and entry.is_file() for entry in it)
+    except OSError:
+        return False
+
+
+def detect_project_type(project_root: Path, root_entries: Dict[str, os.DirEntry],
+                        polyglot: bool = False) -> Tuple[Dict[str, Any], Dict[str, Dict[str, Any]]]:
+    """Detect the primary project type and framework.
+
+    Returns the project info together with the parsed manifests (keyed by
+    file name) so callers can reuse them without re-reading from disk.
+    Detection stops at the first framework found unless ``polyglot`` is set,
+    in which case every ecosystem is checked and later ones take precedence.
+    """
     project_info = {
         "type": "unknown",
         "framework": None,
         "language": None,
         "package_manager": None
     }
+    manifests = {}
 
     # JavaScript/TypeScript projects
-    if (project_root / "package.json").exists():
-        try:
-            with open(project_root / "package.json", "r") as f:
-                pkg = json.load(f)
-                deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
+    if "package.json" in root_entries:
+        pkg = _load_json(project_root / "package.json")
+        if pkg is not None:
+            manifests["package.json"] = pkg
+            try:
+                deps = ChainMap(pkg.get("dependencies", {}), pkg.get("devDependencies", {}))
 
                 if "next" in deps:
                     project_info.update({"type": "frontend", "framework": "Next.js", "language": "JavaScript/TypeScript"})
@@ -38,24 +214,27 @@ def detect_project_type(project_root: Path) -> Dict[str, Any]:
                 elif "nestjs" in deps or "@nestjs/core" in deps:
                     project_info.update({"type": "backend", "framework": "NestJS", "language": "TypeScript"})
 
-                if (project_root / "pnpm-lock.yaml").exists():
+                if "pnpm-lock.yaml" in root_entries:
                     project_info["package_manager"] = "pnpm"
-                elif (project_root / "yarn.lock").exists():
+                elif "yarn.lock" in root_entries:
                     project_info["package_manager"] = "yarn"
-                elif (project_root / "package-lock.json").exists():
+                elif "package-lock.json" in root_entries:
                     project_info["package_manager"] = "npm"
-        except Exception:
-            pass
+
+                if project_info["framework"] and not polyglot:
+                    return project_info, manifests
+            except Exception:
+                pass
 
     # Python projects
-    if (project_root / "requirements.txt").exists() or (project_root / "pyproject.toml").exists():
+    if "requirements.txt" in root_entries or "pyproject.toml" in root_entries:
         project_info["language"] = "Python"
-        if (project_root / "manage.py").exists():
+        if "manage.py" in root_entries:
             project_info.update({"type": "backend", "framework": "Django"})
-        elif (project_root / "app.py").exists() or any((project_root / "app").glob("*.py")):
+        elif "app.py" in root_entries or (_is_dir_entry(root_entries, "app") and _has_py_file(project_root / "app")):
             # Check for Flask
             try:
-                if (project_root / "requirements.txt").exists():
+                if "requirements.txt" in root_entries:
                     with open(project_root / "requirements.txt", "r") as f:
                         reqs = f.read()
                         if "flask" in reqs.lower():
@@ -67,203 +246,201 @@ def detect_project_type(project_root: Path) -> Dict[str, Any]:
 
         project_info["package_manager"] = "pip"
 
+        if project_info["framework"] and not polyglot:
+            return project_info, manifests
+
     # Ruby projects
-    if (project_root / "Gemfile").exists():
+    if "Gemfile" in root_entries:
         project_info.update({"language": "Ruby", "package_manager": "bundler"})
-        if (project_root / "config.ru").exists() or (project_root / "config" / "application.rb").exists():
+        if "config.ru" in root_entries or (_is_dir_entry(root_entries, "config")
+                                           and (project_root / "config" / "application.rb").exists()):
             project_info.update({"type": "backend", "framework": "Ruby on Rails"})
 
+        if project_info["framework"] and not polyglot:
+            return project_info, manifests
+
     # Go projects
-    if (project_root / "go.mod").exists():
+    if "go.mod" in root_entries:
         project_info.update({"language": "Go", "package_manager": "go modules"})
         project_info["type"] = "backend"
 
     # PHP projects
-    if (project_root / "composer.json").exists():
+    if "composer.json" in root_entries:
         project_info.update({"language": "PHP", "package_manager": "composer"})
-        try:
-            with open(project_root / "composer.json", "r") as f:
-                composer = json.load(f)
-                deps = {**composer.get("require", {}), **composer.get("require-dev", {})}
+        composer = _load_json(project_root / "composer.json")
+        if composer is not None:
+            manifests["composer.json"] = composer
+            try:
+                deps = ChainMap(composer.get("require", {}), composer.get("require-dev", {}))
                 if "laravel/framework" in deps:
                     project_info.update({"type": "backend", "framework": "Laravel"})
                 elif "symfony/symfony" in deps:
                     project_info.update({"type": "backend", "framework": "Symfony"})
-        except Exception:
-            pass
+
+                if project_info["framework"] and not polyglot:
+                    return project_info, manifests
+            except Exception:
+                pass
 
     # Java/Kotlin projects
-    if (project_root / "pom.xml").exists():
+    if "pom.xml" in root_entries:
         project_info.update({"language": "Java", "package_manager": "maven"})
         project_info["type"] = "backend"
-    elif (project_root / "build.gradle").exists() or (project_root / "build.gradle.kts").exists():
+    elif "build.gradle" in root_entries or "build.gradle.kts" in root_entries:
         project_info.update({"language": "Java/Kotlin", "package_manager": "gradle"})
         project_info["type"] = "backend"
 
-    return project_info
+    return project_info, manifests
 
 
-def extract_dependencies(project_root: Path, project_type: str) -> Dict[str, str]:
+def extract_dependencies(project_root: Path, project_type: str,
+                         manifests: Dict[str, Dict[str, Any]],
+                         root_entries: Dict[str, os.DirEntry]) -> Dict[str, str]:
     """Extract dependencies with versions."""
     deps = {}
 
     # JavaScript/TypeScript
-    if (project_root / "package.json").exists():
+    pkg = manifests.get("package.json")
+    if pkg is not None:
         try:
-            with open(project_root / "package.json", "r") as f:
-                pkg = json.load(f)
-                all_deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
-                for name, version in all_deps.items():
-                    deps[name] = version.lstrip("^~")
+            for name, version in itertools.chain(pkg.get("dependencies", {}).items(),
+                                                 pkg.get("devDependencies", {}).items()):
+                deps[name] = version.lstrip("^~")
         except Exception:
             pass
 
     # Python
-    if (project_root / "requirements.txt").exists():
+    if "requirements.txt" in root_entries:
         try:
             with open(project_root / "requirements.txt", "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        match = re.match(r"([a-zA-Z0-9_-]+)([=><]+)?([\d.]+)?", line)
-                        if match:
-                            pkg_name, _, version = match.groups()
-                            deps[pkg_name] = version or "latest"
+                for raw in f:
+                    # Skip comment and blank lines before paying for strip()
+                    if raw[0] in "#\r\n":
+                        continue
+                    line = raw.strip()
+                    if not line or line[0] == "#":
+                        continue
+                    match = _REQ_LINE_RE.match(line)
+                    if match:
+                        pkg_name, _, version = match.groups()
+                        deps[pkg_name] = version or "latest"
         except Exception:
             pass
 
     return deps
 
 
-def detect_database(project_root: Path, dependencies: Dict[str, str]) -> Optional[Dict[str, str]]:
-    """Detect database technology."""
-    db_info = None
-
-    # Check dependencies for database drivers
-    db_keywords = {
-        "postgresql": ["pg", "psycopg2", "postgres"],
-        "mysql": ["mysql", "mysql2", "pymysql"],
-        "mongodb": ["mongodb", "mongoose", "pymongo"],
-        "redis": ["redis", "ioredis"],
-        "sqlite": ["sqlite", "sqlite3"],
-        "convex": ["convex"],
-        "supabase": ["supabase"],
-        "firebase": ["firebase"],
-    }
-
-    for db_name, keywords in db_keywords.items():
-        for dep in dependencies.keys():
-            if any(kw in dep.lower() for kw in keywords):
-                db_info = {"type": db_name, "driver": dep}
-                break
-        if db_info:
+def _classification_settled(found: Dict[str, Dict[str, Tuple[int, str]]]) -> bool:
+    """True once no further dependency can change the classification."""
+    for category, table in _CATEGORY_TABLES.items():
+        if category in _SINGLE_MATCH_CATEGORIES:
+            if next(iter(table)) not in found[category]:
+                return False
+        elif len(found[category]) < len(table):
+            return False
+    return True
+
+
+def classify_dependencies(lowered_deps: List[Tuple[str, str]]) -> Dict[str, Any]:
+    """Detect database, auth, payment and email providers in a single pass over dependencies."""
+    # category -> provider -> (rank, first dependency mentioning it)
+    found = {category: {} for category in _CATEGORY_TABLES}
+    for dep, dep_lower in lowered_deps:
+        grew = False
+        for hits in _keyword_hits(dep_lower):
+            for kw, category, rank, provider in hits:
+                if category in _CASE_SENSITIVE_CATEGORIES and kw not in dep:
+                    continue
+                if provider not in found[category]:
+                    found[category][provider] = (rank, dep)
+                    grew = True
+        # Only a new provider can settle the classification
+        if grew and _classification_settled(found):
             break
 
-    # Check for environment variables
-    env_files = [".env", ".env.local", ".env.example"]
-    for env_file in env_files:
-        env_path = project_root / env_file
-        if env_path.exists():
-            try:
-                with open(env_path, "r") as f:
-                    content = f.read()
-                    if "DATABASE_URL" in content or "DB_HOST" in content:
-                        if not db_info:
-                            db_info = {"type": "detected via env vars"}
-                        db_info["env_configured"] = True
-            except Exception:
-                pass
-
-    return db_info
-
+    ranked = {category: sorted((rank, provider, dep) for provider, (rank, dep) in providers.items())
+              for category, providers in found.items()}
+    database = ranked["database"][0] if ranked["database"] else None
+    auth = ranked["auth"][0] if ranked["auth"] else None
 
-def detect_auth(dependencies: Dict[str, str]) -> Optional[Dict[str, str]]:
-    """Detect authentication solution."""
-    auth_keywords = {
-        "NextAuth.js": ["next-auth"],
-        "Auth0": ["auth0"],
-        "Firebase Auth": ["firebase"],
-        "Clerk": ["@clerk/"],
-        "Supabase Auth": ["@supabase/"],
-        "Passport": ["passport"],
-        "JWT": ["jsonwebtoken", "jwt"],
-        "Convex Auth": ["@convex-dev/auth"],
-        "Stack Auth": ["@stackframe/"],
+    return {
+        "database": {"type": database[1], "driver": database[2]} if database else None,
+        "auth": {"provider": auth[1], "package": auth[2]} if auth else None,
+        "payment": [{"provider": provider, "package": dep} for _, provider, dep in ranked["payment"]],
+        "email": [{"provider": provider, "package": dep} for _, provider, dep in ranked["email"]],
     }
 
-    for auth_name, keywords in auth_keywords.items():
-        for dep in dependencies.keys():
-            if any(kw in dep for kw in keywords):
-                return {"provider": auth_name, "package": dep}
 
-    return None
-
-
-def detect_payment_providers(dependencies: Dict[str, str]) -> List[Dict[str, str]]:
-    """Detect payment integrations."""
-    providers = []
-
-    payment_keywords = {
-        "Stripe": ["stripe"],
-        "PayPal": ["paypal"],
-        "Square": ["square"],
-        "Braintree": ["braintree"],
-    }
-
-    for provider_name, keywords in payment_keywords.items():
-        for dep in dependencies.keys():
-            if any(kw in dep.lower() for kw in keywords):
-                providers.append({"provider": provider_name, "package": dep})
-                break
+def detect_database(project_root: Path, driver_info: Optional[Dict[str, str]],
+                    root_entries: Dict[str, os.DirEntry]) -> Optional[Dict[str, str]]:
+    """Detect database technology from the driver found in dependencies and env files."""
+    db_info = dict(driver_info) if driver_info else None
 
-    return providers
-
-
-def detect_email_providers(dependencies: Dict[str, str]) -> List[Dict[str, str]]:
-    """Detect email service integrations."""
-    providers = []
-
-    email_keywords = {
-        "Resend": ["resend"],
-        "SendGrid": ["sendgrid"],
-        "Mailgun": ["mailgun"],
-        "Postmark": ["postmark"],
-        "Nodemailer": ["nodemailer"],
-    }
-
-    for provider_name, keywords in email_keywords.items():
-        for dep in dependencies.keys():
-            if any(kw in dep.lower() for kw in keywords):
-                providers.append({"provider": provider_name, "package": dep})
+    # Check for environment variables
+    for env_file in ENV_FILES:
+        if env_file in root_entries:
+            env_path = project_root / env_file
+            try:
+                # Empty files cannot be mapped and raise ValueError, i.e. no match
+                with open(env_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    configured = mm.find(b"DATABASE_URL") != -1 or mm.find(b"DB_HOST") != -1
+            except Exception:
+                continue
+            if configured:
+                if not db_info:
+                    db_info = {"type": "detected via env vars"}
+                db_info["env_configured"] = True
                 break
 
-    return providers
+    return db_info
 
 
-def detect_hosting(project_root: Path) -> Optional[str]:
+def detect_hosting(project_root: Path, root_entries: Dict[str, os.DirEntry]) -> Optional[str]:
     """Detect hosting platform."""
-    hosting_indicators = {
-        "Netlify": ["netlify.toml", "netlify"],
-        "Vercel": ["vercel.json", ".vercel"],
-        "AWS": [".aws", "serverless.yml"],
-        "Heroku": ["Procfile"],
-        "Docker": ["Dockerfile", "docker-compose.yml"],
-    }
-
-    for platform, files in hosting_indicators.items():
-        for file_indicator in files:
-            if (project_root / file_indicator).exists():
-                return platform
+    for platform, files in HOSTING_INDICATORS.items():
+        if any(f in root_entries for f in files):
+            return platform
 
     return None
 
 
-def analyze_project(project_root: str) -> Dict[str, Any]:
-    """Main analysis function."""
-    root = Path(project_root)
+# Paths (relative to the project root) whose mtime or size invalidate a cached analysis.
+# The root itself covers files being added or removed; the rest are read for content.
+_FINGERPRINT_PATHS = (
+    ".", "package.json", "composer.json", "requirements.txt", *ENV_FILES, "app", "config",
+)
+
+
+def _fingerprint(root: Path) -> Tuple[Tuple[str, Optional[int], Optional[int]], ...]:
+    """Collect the mtimes and sizes that decide whether a cached analysis is still valid.
 
-    project_info = detect_project_type(root)
-    dependencies = extract_dependencies(root, project_info["type"])
+    The size catches rewrites that keep the mtime, e.g. on filesystems with
+    coarse timestamps.
+    """
+    stamps = []
+    for name in _FINGERPRINT_PATHS:
+        try:
+            st = os.stat(root / name)
+            stamps.append((name, st.st_mtime_ns, st.st_size))
+        except OSError:
+            stamps.append((name, None, None))
+    return tuple(stamps)
+
+
+@lru_cache(maxsize=32)
+def _cached_analyze(root_str: str, fingerprint: Tuple[Tuple[str, Optional[int], Optional[int]], ...],
+                    polyglot: bool = False) -> Dict[str, Any]:
+    """Run the analysis for a resolved root; ``fingerprint`` only keys the cache."""
+    root = Path(root_str)
+    root_entries = _scan_root(root)
+
+    project_info, manifests = detect_project_type(root, root_entries, polyglot)
+    dependencies = extract_dependencies(root, project_info["type"], manifests, root_entries)
+    lowered_deps = [(name, name.lower()) for name in dependencies]
+    # Detection stays sequential: provider matching is a single fused pass and
+    # hosting only checks the root listing, so a thread pool would cost more
+    # than the one remaining env file read it could overlap.
+    providers = classify_dependencies(lowered_deps)
 
     analysis = {
         "project_root": str(root.resolve()),
@@ -273,23 +450,45 @@ def analyze_project(project_root: str) -> Dict[str, Any]:
         "language": project_info["language"],
         "package_manager": project_info["package_manager"],
         "dependencies": dependencies,
-        "database": detect_database(root, dependencies),
-        "auth": detect_auth(dependencies),
-        "payment_providers": detect_payment_providers(dependencies),
-        "email_providers": detect_email_providers(dependencies),
-        "hosting": detect_hosting(root),
+        "database": detect_database(root, providers["database"], root_entries),
+        "auth": providers["auth"],
+        "payment_providers": providers["payment"],
+        "email_providers": providers["email"],
+        "hosting": detect_hosting(root, root_entries),
     }
 
     return analysis
 
 
+def analyze_project(project_root: str, polyglot: bool = False) -> Dict[str, Any]:
+    """Main analysis function.
+
+    Results are memoized per resolved root and reused until the root listing
+    or one of the inspected files changes. See ``detect_project_type`` for
+    ``polyglot``.
+    """
+    root = Path(project_root)
+    resolved = root.resolve()
+    analysis = copy.deepcopy(_cached_analyze(str(resolved), _fingerprint(resolved), polyglot))
+    # Keep the name as given, e.g. "" for ".", like the uncached version did
+    analysis["project_name"] = root.name
+    return analysis
+
+
 if __name__ == "__main__":
     import sys
 
-    if len(sys.argv) < 2:
-        print("Usage: python analyze_codebase.py <project_root>")
+    args = sys.argv[1:]
+    polyglot = "--polyglot" in args
+    args = [arg for arg in args if arg != "--polyglot"]
+
+    if not args:
+        print("Usage: python analyze_codebase.py [--polyglot] <project_root>")
         sys.exit(1)
 
-    project_root = sys.argv[1]
-    result = analyze_project(project_root)
-    print(json.dumps(result, indent=2))
+    project_root = args[0]
+    result = analyze_project(project_root, polyglot=polyglot)
+    if orjson is not None:
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_INDENT_2) + b"\n")
+    else:
+        print(json.dumps(result, indent=2))